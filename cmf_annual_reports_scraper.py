@@ -3,7 +3,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from io import StringIO
 import pandas as pd
 from selenium.common.exceptions import TimeoutException
@@ -24,14 +24,8 @@ wait = WebDriverWait(driver, 10)
 form = wait.until(EC.presence_of_element_located((By.ID, "fm")))
 
 # Busca el name de la company con el class ntg-page-header
-company_name = driver.find_element(By.ID, "datos_ent").text[0:]
-lines = company_name.split("\n")  # Divide el texto en líneas
-company_name = lines[1]  # El nombre de la empresa es la segunda línea
-
-# Crea un escritor de Excel
-writer = pd.ExcelWriter(
-    f"./data/Reports/{company_name}_Financials.xlsx", engine="xlsxwriter"
-)
+# El nombre de la empresa es la segunda línea, solo se separan las dos primeras
+company_name = driver.find_element(By.ID, "datos_ent").text.split("\n", 2)[1]
 
 # Encuentra las tablas dentro de los divs con los ids especificados
 ids = ["ESFC", "ERF", "ERN", "EFEMD"]
@@ -39,6 +33,18 @@ ids = ["ESFC", "ERF", "ERN", "EFEMD"]
 # Crea un DataFrame vacío para cada id
 dataframes = {id: pd.DataFrame() for id in ids}
 
+# Mapeo de nombres de conceptos, se construye una sola vez fuera del ciclo de años
+concept_name_mapping = {
+    # Nombre Antiguo --- Nombre Nuevo
+    "Capital emitido": "Capital emitido y pagado",
+    "Diferencias de cambio": "Ganancias (pérdidas) de cambio en moneda extranjera",
+    "Flujos de efectivo netos procedentes de (utilizados en) la operación": "Flujos de efectivo netos procedentes de (utilizados en) operaciones",
+    "Pagos de préstamos a entidades relacionadas": "Pagos de préstamos de entidades relacionadas",
+    "Pagos de pasivos por arrendamientos financieros": "Pagos de pasivos por arrendamientos",
+    "Pagos por cambios en las participaciones en la propiedad en subsidiarias que no resulta en una pérdida de control": "Pagos por cambios en las participaciones en la propiedad en subsidiarias que no dan lugar a la pérdida de control",
+    # Agrega más mapeos según sea necesario
+}
+
 # Bucle para recopilar datos de varios años en este caso 10 años
 # el -2 se utiliza por el hecho de que la página de la CMF brinda información cada 2 años.
 for year in range(2022, 2012, -2):
@@ -67,18 +73,8 @@ for year in range(2022, 2012, -2):
         print(f"No se encontró la tabla para el año {year}. Deteniendo el ciclo.")
         continue
     # Extrae la información de la tabla con BeautifulSoup
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-
-    concept_name_mapping = {
-        # Nombre Antiguo --- Nombre Nuevo
-        "Capital emitido": "Capital emitido y pagado",
-        "Diferencias de cambio": "Ganancias (pérdidas) de cambio en moneda extranjera",
-        "Flujos de efectivo netos procedentes de (utilizados en) la operación": "Flujos de efectivo netos procedentes de (utilizados en) operaciones",
-        "Pagos de préstamos a entidades relacionadas": "Pagos de préstamos de entidades relacionadas",
-        "Pagos de pasivos por arrendamientos financieros": "Pagos de pasivos por arrendamientos",
-        "Pagos por cambios en las participaciones en la propiedad en subsidiarias que no resulta en una pérdida de control": "Pagos por cambios en las participaciones en la propiedad en subsidiarias que no dan lugar a la pérdida de control",
-        # Agrega más mapeos según sea necesario
-    }
+    # (solo se construye el árbol de los divs de los estados financieros, no de toda la página)
+    soup = BeautifulSoup(driver.page_source, "lxml", parse_only=SoupStrainer(id=ids))
 
     for id in ids:
         tabla = soup.find(id=id)
@@ -97,27 +93,33 @@ for year in range(2022, 2012, -2):
                 # Código para manejar EFEMD
                 pass
 
-            # Crea una copia del DataFrame antes de modificarlo
-            df = df.copy()
-            # Elimina las filas que contienen la palabra "sinopsis" en la primera columna
-            df = df[~df[df.columns[0]].str.contains("sinopsis")]
+            # Nombre de la columna de conceptos (primera columna de la tabla)
+            concepto = df.columns[0]
+
+            # df es un DataFrame nuevo de read_html, se modifica directamente sin copiarlo
             # Reemplaza los guiones que están solos por ceros, pero mantiene la primera columna
-            df.iloc[:, 1:] = df.iloc[:, 1:].replace("^-$", "0", regex=True)
+            df.iloc[:, 1:] = df.iloc[:, 1:].replace("-", "0")
 
             # Reemplaza los nombres antiguos de los conceptos por los nuevos
-            df[df.columns[0]] = df[df.columns[0]].replace(concept_name_mapping)
+            # (una sola búsqueda en el diccionario por fila, en vez de una pasada por cada mapeo)
+            df[concepto] = df[concepto].map(concept_name_mapping).fillna(df[concepto])
+
+            # Elimina las filas que contienen la palabra "sinopsis" en la primera columna
+            # (se filtra al final para no modificar un subconjunto del DataFrame)
+            df = df[~df[concepto].str.contains("sinopsis", regex=False)]
 
             # Si dataframes[id] no está vacío, solo agrega las filas cuyo nombre de concepto ya existe en dataframes[id]
             if not dataframes[id].empty:
+                concepto_acumulado = dataframes[id].columns[0]
                 # Renombra la primera columna para que coincida con la de dataframes[id]
-                df = df.rename(columns={df.columns[0]: dataframes[id].columns[0]})
+                df = df.rename(columns={concepto: concepto_acumulado})
                 # Realiza un merge en el nombre del concepto
                 dataframes[id] = pd.merge(
-                    dataframes[id], df, on=dataframes[id].columns[0], how="outer"
+                    dataframes[id], df, on=concepto_acumulado, how="outer"
                 )
                 # Elimina duplicados basados en la primera columna (nombre del concepto)
                 dataframes[id] = dataframes[id].drop_duplicates(
-                    subset=dataframes[id].columns[0]
+                    subset=concepto_acumulado
                 )
             else:
                 # Si dataframes[id] está vacío, agrega df tal como está
@@ -133,11 +135,15 @@ Names_Sheet = {
     "EFEMD": "Estado de Flujo de Efectivo",
 }
 
-for id in ids:
-    if not dataframes[id].empty:
-        dataframes[id].to_excel(writer, sheet_name=Names_Sheet[id], index=False)
-
-writer.close()
+# Crea el escritor de Excel solo al final, cuando los datos ya están recopilados
+with pd.ExcelWriter(
+    f"./data/Reports/{company_name}_Financials.xlsx", engine="xlsxwriter"
+) as writer:
+    for id in ids:
+        if not dataframes[id].empty:
+            dataframes[id].to_excel(writer, sheet_name=Names_Sheet[id], index=False)
+            # Oculta las líneas de cuadrícula de la hoja (en pantalla y al imprimir)
+            writer.sheets[Names_Sheet[id]].hide_gridlines(2)
 
 # Cierra el navegador
 driver.quit()
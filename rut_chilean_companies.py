@@ -3,9 +3,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from io import StringIO
 import pandas as pd
+import re
 
 # Configura el WebDriver (en este caso, Chrome)
 driver = webdriver.Chrome()
@@ -28,7 +29,13 @@ driver.find_element(By.CLASS_NAME, "mime_bot_consultar").click()
 wait.until(EC.presence_of_element_located((By.CLASS_NAME, "table-responsive")))
 
 # Extrae la información de la tabla con BeautifulSoup
-soup = BeautifulSoup(driver.page_source, "html.parser")
+# (solo se construye el árbol del contenedor de la tabla, no de toda la página)
+soup = BeautifulSoup(
+    driver.page_source,
+    "lxml",
+    # Se compara la clase como palabra, el atributo class puede traer más de una clase
+    parse_only=SoupStrainer(class_=re.compile(r"(^|\s)table-responsive(\s|$)")),
+)
 
 tabla = soup.find(class_="table-responsive")
 